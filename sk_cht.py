@@ -1,74 +1,212 @@
 import os
 import sys
-import ctypes
 import traceback
+import re
 import json
 import shutil
 import time
+import functools
 import collections.abc
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
-# UnityPy and related imports
-import UnityPy
-import UnityPy.config
-from UnityPy.files import BundleFile, SerializedFile
-from UnityPy.helpers.TypeTreeGenerator import TypeTreeGenerator
-from UnityPy.export import Texture2DConverter
-from UnityPy.streams import EndianBinaryReader
-from UnityPy.enums import ClassIDType, TextureFormat
-import etcpak
+# orjson 為選用加速：C 實作的解析器對 glyph 這種巨大數值陣列快 3-5 倍，
+# 沒安裝時退回標準庫 json。
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Standard library imports
-from io import BytesIO
-from PIL import Image
+
+# ==============================================================================
+# --- 重量級匯入延遲載入 ---
+# ==============================================================================
+# UnityPy / PIL / etcpak 匯入成本高 (UnityPy 單獨就要數百毫秒)，
+# 延後到真正執行中文化時才載入，讓「還原備份」「關於」等流程近乎即時啟動。
+UnityPy = None
+BundleFile = None
+SerializedFile = None
+TypeTreeGenerator = None
+Texture2DConverter = None
+EndianBinaryReader = None
+ClassIDType = None
+TextureFormat = None
+etcpak = None
+Image = None
+
+_HEAVY_IMPORTS_READY = False
+
+def _ensure_heavy_imports():
+    """匯入 UnityPy / PIL / etcpak 並套用 BC7 補丁，只會實際執行一次。"""
+    global _HEAVY_IMPORTS_READY, UnityPy, BundleFile, SerializedFile, TypeTreeGenerator
+    global Texture2DConverter, EndianBinaryReader, ClassIDType, TextureFormat, etcpak, Image
+    if _HEAVY_IMPORTS_READY:
+        return
+    import UnityPy as _UnityPy
+    import UnityPy.config  # noqa: F401 (供 FALLBACK_UNITY_VERSION 設定)
+    from UnityPy.files import BundleFile as _BundleFile, SerializedFile as _SerializedFile
+    from UnityPy.helpers.TypeTreeGenerator import TypeTreeGenerator as _TypeTreeGenerator
+    from UnityPy.export import Texture2DConverter as _Texture2DConverter
+    from UnityPy.streams import EndianBinaryReader as _EndianBinaryReader
+    from UnityPy.enums import ClassIDType as _ClassIDType, TextureFormat as _TextureFormat
+    import etcpak as _etcpak
+    from PIL import Image as _Image
+    UnityPy = _UnityPy
+    BundleFile = _BundleFile
+    SerializedFile = _SerializedFile
+    TypeTreeGenerator = _TypeTreeGenerator
+    Texture2DConverter = _Texture2DConverter
+    EndianBinaryReader = _EndianBinaryReader
+    ClassIDType = _ClassIDType
+    TextureFormat = _TextureFormat
+    etcpak = _etcpak
+    Image = _Image
+    _install_bc7_patch()
+    _HEAVY_IMPORTS_READY = True
 
 # ==============================================================================
 # --- Monkey-Patch for BC7 Compression ---
 # ==============================================================================
-print("[資訊] 應用 BC7 壓縮修正補丁...")
-original_compress_etcpak = Texture2DConverter.compress_etcpak
-def patched_compress_etcpak(data: bytes, width: int, height: int, target_texture_format: TextureFormat) -> bytes:
-    if target_texture_format == TextureFormat.BC7:
-        params = etcpak.BC7CompressBlockParams()
-        return etcpak.compress_bc7(data, width, height, params)
+# 補丁於 _install_bc7_patch() 內安裝 (由 _ensure_heavy_imports 呼叫)
+original_compress_etcpak = None
+# 參數結構只建一次；enum 成員是單例，用 is 做身份比較即可
+_BC7_PARAMS = None
+
+def _compress_bc7_parallel(data: bytes, width: int, height: int) -> bytes:
+    """把影像切成 4 像素列對齊的橫條，多執行緒並行做 BC7 壓縮。
+
+    BC7 以獨立的 4x4 區塊編碼，逐條壓縮後依序串接即為正確輸出；
+    etcpak 在 C 層會釋放 GIL，執行緒即可吃滿多核心。
+    """
+    workers = os.cpu_count() or 1
+    if workers <= 1 or height < 256 or height % 4 != 0:
+        return etcpak.compress_bc7(data, width, height, _BC7_PARAMS)
+    block_rows = height // 4
+    rows_per_stripe = (block_rows + workers - 1) // workers
+    stride = width * 4  # RGBA 每列位元組數
+    view = memoryview(data)
+    stripes = []
+    for block_row in range(0, block_rows, rows_per_stripe):
+        stripe_height = min(rows_per_stripe, block_rows - block_row) * 4
+        start = block_row * 4 * stride
+        stripes.append((bytes(view[start:start + stripe_height * stride]), stripe_height))
+    with ThreadPoolExecutor(max_workers=len(stripes)) as executor:
+        results = executor.map(
+            lambda stripe: etcpak.compress_bc7(stripe[0], width, stripe[1], _BC7_PARAMS), stripes)
+    return b"".join(results)
+
+def patched_compress_etcpak(data: bytes, width: int, height: int, target_texture_format) -> bytes:
+    if target_texture_format is TextureFormat.BC7:
+        return _compress_bc7_parallel(data, width, height)
     else:
         return original_compress_etcpak(data, width, height, target_texture_format)
-Texture2DConverter.compress_etcpak = patched_compress_etcpak
-print("[資訊] 補丁應用成功。")
+
+def _install_bc7_patch():
+    global original_compress_etcpak, _BC7_PARAMS
+    print("[資訊] 應用 BC7 壓縮修正補丁...")
+    original_compress_etcpak = Texture2DConverter.compress_etcpak
+    _BC7_PARAMS = etcpak.BC7CompressBlockParams()
+    Texture2DConverter.compress_etcpak = patched_compress_etcpak
+    print("[資訊] 補丁應用成功。")
 
 # ==============================================================================
 # --- 0. 執行環境與權限檢查 ---
 # ==============================================================================
+# 權限狀態在程序生命週期內不變，快取住免去重複的 ctypes Win32 呼叫；
+# 非 Windows 平台先短路，連 windll 都不碰
+@functools.lru_cache(maxsize=1)
 def is_admin():
+    if sys.platform != 'win32':
+        return False
+    import ctypes
     try: return ctypes.windll.shell32.IsUserAnAdmin()
     except: return False
 
 def run_as_admin():
     if sys.platform == 'win32':
-        ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
-
+        import ctypes
+        import subprocess
+        # list2cmdline 依 Windows 規則正確引號化，路徑含空白時
+        # " ".join 會讓重啟後的參數被錯誤切割
+        params = subprocess.list2cmdline(sys.argv)
+        ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
+
+# 腳本所在目錄在程序生命週期內不變，abspath/dirname 只做一次
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 凍結狀態與腳本位置在程序生命週期內不變，結果快取一次
+@functools.lru_cache(maxsize=1)
 def get_base_path():
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         return sys._MEIPASS
     else:
-        return os.path.dirname(os.path.abspath(__file__))
+        return _SCRIPT_DIR
 
 # ==============================================================================
 # --- FileWrapper 輔助類別 ---
 # ==============================================================================
 class FileWrapper:
-    def __init__(self, original_file, new_data_stream):
+    # __slots__ 讓屬性解析走 C 層 slot 查找；UnityPy 存檔時會對每個
+    # 包裝檔案反覆探測 flag/path/name 等屬性，預先快取成實體屬性
+    # 可免去成千上萬次 __getattr__ 的 Python 層轉發
+    __slots__ = ("_original", "_buf", "_mv", "_pos", "flag", "path", "name")
+
+    def __init__(self, original_file, new_data):
         self._original = original_file
-        self._stream = new_data_stream
+        # 直接持有不可變位元組緩衝＋整數游標，取代內部 BytesIO：
+        # 省掉一次整份資料的複製，save() 也能零複製地回傳同一個緩衝。
+        # 相容舊呼叫慣例，bytes-like 以外也接受 BytesIO 或任意檔案物件。
+        if isinstance(new_data, (bytes, bytearray)):
+            self._buf = new_data
+        elif hasattr(new_data, "getvalue"):
+            self._buf = new_data.getvalue()
+        else:
+            pos = new_data.tell()
+            new_data.seek(0)
+            self._buf = new_data.read()
+            new_data.seek(pos)
+        # 唯讀 view 供 read_bytes 切片：每次讀取回傳零複製的 memoryview，
+        # struct.unpack_from 等緩衝區介面消費者可直接使用
+        self._mv = memoryview(self._buf)
+        self._pos = 0
+        for attr in ("flag", "path", "name"):
+            # 原始物件沒有的屬性不先佔 slot，維持 __getattr__ 的
+            # AttributeError 語意不變
+            if hasattr(original_file, attr):
+                setattr(self, attr, getattr(original_file, attr))
     @property
-    def Length(self): return len(self._stream.getbuffer())
+    def Length(self): return len(self._buf)
     @property
-    def Position(self): return self._stream.tell()
+    def Position(self): return self._pos
     @Position.setter
-    def Position(self, value): self._stream.seek(value)
-    def read_bytes(self, length): return self._stream.read(length)
+    def Position(self, value): self._pos = value
+    def read_bytes(self, length):
+        # 與 BytesIO.read 同語意：短讀時游標停在緩衝尾端，
+        # Position 永不超過 Length
+        pos = self._pos
+        end = min(pos + length, len(self._buf))
+        self._pos = end
+        return self._mv[pos:end]
+    def read_bytes_into(self, buf):
+        """readinto 風格讀取：寫進呼叫端提供的緩衝，回傳實際複製的位元組數。
+
+        逐小段解析標頭的迴圈可重複使用同一個 bytearray，
+        讀取次數再多也只有一次配置。
+        """
+        pos = self._pos
+        end = min(pos + len(buf), len(self._buf))
+        copied = end - pos
+        # 游標已在 (或超過) 緩衝尾端時依 readinto 慣例回傳 0，
+        # 不得用負數切片縮短呼叫端的緩衝
+        if copied <= 0:
+            return 0
+        buf[:copied] = self._mv[pos:end]
+        self._pos = end
+        return copied
     def save(self):
-        self.Position = 0
-        return self._stream.read()
+        # 回傳唯讀 view 而非 bytes 複本：下游寫檔/串接都吃緩衝區介面，
+        # 整條寫出路徑得以零複製。呼叫端不得就地修改回傳值。
+        return self._mv
     def __getattr__(self, name): return getattr(self._original, name)
         
 # ==============================================================================
@@ -80,29 +218,34 @@ BUNDLE_FILE_PATH = None
 TEXT_ASSETS_FILE_PATH = None
 TITLE_BUNDLE_PATH = None
 
-if sys.platform == "win32":
-    PLATFORM_NAME = "Windows"
-    SILKSONG_DATA_PATH = os.path.join(GAME_ROOT_PATH, "Hollow Knight Silksong_Data")
-    STREAMING_ASSETS_PLATFORM_PATH = os.path.join(SILKSONG_DATA_PATH, "StreamingAssets", "aa", "StandaloneWindows64")
-    BUNDLE_FILE_PATH = os.path.join(STREAMING_ASSETS_PLATFORM_PATH, "fonts_assets_chinese.bundle")
-    TITLE_BUNDLE_PATH = os.path.join(STREAMING_ASSETS_PLATFORM_PATH, "atlases_assets_assets", "sprites", "_atlases", "title.spriteatlas.bundle")
-    TEXT_ASSETS_FILE_PATH = os.path.join(SILKSONG_DATA_PATH, "resources.assets")
-elif sys.platform == "darwin":
-    PLATFORM_NAME = "macOS"
-    SILKSONG_DATA_PATH = os.path.join(GAME_ROOT_PATH, "Hollow Knight Silksong.app", "Contents", "Resources", "Data")
-    STREAMING_ASSETS_PLATFORM_PATH = os.path.join(SILKSONG_DATA_PATH, "StreamingAssets", "aa", "StandaloneOSX")
-    BUNDLE_FILE_PATH = os.path.join(STREAMING_ASSETS_PLATFORM_PATH, "fonts_assets_chinese.bundle")
-    TITLE_BUNDLE_PATH = os.path.join(STREAMING_ASSETS_PLATFORM_PATH, "atlases_assets_assets", "sprites", "_atlases", "title.spriteatlas.bundle")
-    TEXT_ASSETS_FILE_PATH = os.path.join(SILKSONG_DATA_PATH, "resources.assets")
-elif sys.platform.startswith("linux"):
-    PLATFORM_NAME = "Linux"
-    SILKSONG_DATA_PATH = os.path.join(GAME_ROOT_PATH, "Hollow Knight Silksong_Data")
-    STREAMING_ASSETS_PLATFORM_PATH = os.path.join(SILKSONG_DATA_PATH, "StreamingAssets", "aa", "StandaloneLinux64")
+# 各平台只差在資料目錄位置與 StreamingAssets 平台資料夾名稱，
+# 這裡查表一次算出所有路徑常數，避免三段重複的組路徑程式碼。
+_PLATFORM_CONFIG = {
+    "win32": ("Windows", ("Hollow Knight Silksong_Data",), "StandaloneWindows64"),
+    "darwin": ("macOS", ("Hollow Knight Silksong.app", "Contents", "Resources", "Data"), "StandaloneOSX"),
+    "linux": ("Linux", ("Hollow Knight Silksong_Data",), "StandaloneLinux64"),
+}
+_platform_key = "linux" if sys.platform.startswith("linux") else sys.platform
+if _platform_key in _PLATFORM_CONFIG:
+    PLATFORM_NAME, _data_parts, _platform_folder = _PLATFORM_CONFIG[_platform_key]
+    SILKSONG_DATA_PATH = os.path.join(GAME_ROOT_PATH, *_data_parts)
+    STREAMING_ASSETS_PLATFORM_PATH = os.path.join(SILKSONG_DATA_PATH, "StreamingAssets", "aa", _platform_folder)
     BUNDLE_FILE_PATH = os.path.join(STREAMING_ASSETS_PLATFORM_PATH, "fonts_assets_chinese.bundle")
     TITLE_BUNDLE_PATH = os.path.join(STREAMING_ASSETS_PLATFORM_PATH, "atlases_assets_assets", "sprites", "_atlases", "title.spriteatlas.bundle")
     TEXT_ASSETS_FILE_PATH = os.path.join(SILKSONG_DATA_PATH, "resources.assets")
 
 UNITY_VERSION = "6000.0.50f1"
+
+# 目標 TextAsset 名稱集合：凍結並 intern，掃描整個 resources.assets 時
+# 每個 m_Name 的集合查找可以走 CPython 的指標相等快速路徑。
+TEXT_TARGET_ASSETS = frozenset(sys.intern(name) for name in (
+    "ZH_Achievements", "ZH_AutoSaveNames", "ZH_Belltown", "ZH_Bonebottom", "ZH_Caravan", "ZH_City",
+    "ZH_Coral", "ZH_Crawl", "ZH_Credits List", "ZH_Deprecated", "ZH_Dust", "ZH_Enclave", "ZH_Error",
+    "ZH_Fast Travel", "ZH_Forge", "ZH_General", "ZH_Greymoor", "ZH_Inspect", "ZH_Journal", "ZH_Lore",
+    "ZH_MainMenu", "ZH_Map Zones", "ZH_Peak", "ZH_Pilgrims", "ZH_Prompts", "ZH_Quests", "ZH_Shellwood",
+    "ZH_Shop", "ZH_Song", "ZH_Titles", "ZH_Tools", "ZH_UI", "ZH_Under", "ZH_Wanderers", "ZH_Weave",
+    "ZH_Wilds",
+))
 BACKUP_FOLDER = os.path.join(GAME_ROOT_PATH, "Backup")
 BUNDLED_DATA_PATH = get_base_path()
 CHT_FOLDER_PATH = os.path.join(BUNDLED_DATA_PATH, "CHT")
@@ -111,20 +254,171 @@ PNG_SOURCE_FOLDER = os.path.join(CHT_FOLDER_PATH, "Png")
 TEXT_SOURCE_FOLDER = os.path.join(CHT_FOLDER_PATH, "Text")
 TEMP_WORKSPACE_FOLDER = os.path.join(GAME_ROOT_PATH, "temp_workspace")
 
+# 打包輸出路徑由上面的常數決定，一次算好供步驟 3/4 直接引用
+MODIFIED_BUNDLE_PATH = os.path.join(TEMP_WORKSPACE_FOLDER, os.path.basename(BUNDLE_FILE_PATH)) if BUNDLE_FILE_PATH else None
+MODIFIED_TEXT_ASSETS_PATH = os.path.join(TEMP_WORKSPACE_FOLDER, os.path.basename(TEXT_ASSETS_FILE_PATH)) if TEXT_ASSETS_FILE_PATH else None
+MODIFIED_TITLE_BUNDLE_PATH = os.path.join(TEMP_WORKSPACE_FOLDER, os.path.basename(TITLE_BUNDLE_PATH)) if TITLE_BUNDLE_PATH else None
+
+# (來源, 備份) 路徑對一次算好；run_modding 與 restore_backup 共用，
+# 不必每次動作重算 relpath/join。不支援的平台上為空列表。
+if BUNDLE_FILE_PATH:
+    BACKUP_PAIRS = [
+        (source_path, os.path.join(BACKUP_FOLDER, os.path.relpath(source_path, GAME_ROOT_PATH)))
+        for source_path in (BUNDLE_FILE_PATH, TEXT_ASSETS_FILE_PATH, TITLE_BUNDLE_PATH)
+    ]
+else:
+    BACKUP_PAIRS = []
+
 # ==============================================================================
 # --- 輔助函數 ---
 # ==============================================================================
+# 保留字母數字 (含 CJK) 與 " .-_()"，其餘字元刪除；\w 已涵蓋底線與
+# Unicode 字母數字，整串替換在 C 層一次完成，不再逐字元走 Python 迴圈
+_SANITIZE_RE = re.compile(r"[^\w .\-()]")
+
 def sanitize_filename(name):
-    return "".join(c for c in name if c.isalnum() or c in " .-_()").replace(" ", "_")
+    return _SANITIZE_RE.sub("", name).replace(" ", "_")
+
+# 單次使用者操作內的 stat 快取：同一批路徑會被重複檢查，
+# 每次 os.path.exists 都是一次 stat syscall (網路磁碟上尤其明顯)。
+_STAT_CACHE = {}
+
+def _stat(path):
+    try:
+        result = _STAT_CACHE[path]
+    except KeyError:
+        try:
+            result = os.stat(path)
+        except OSError:
+            # 與 os.path.exists 同語意：權限不足等任何 OSError 都視為
+            # 不存在，讓前置檢查顯示友善訊息而非未捕捉的 traceback
+            result = None
+        _STAT_CACHE[path] = result
+    return result
+
+def _path_exists(path):
+    return _stat(path) is not None
+
+# 逐資產的進度訊息先累積再一次寫出：每個 print 都要取得 stdout 鎖並
+# flush，在 Windows 主控台上掃描數千資產時相當可觀。
+_LOG_BUFFER = []
+_LOG_FLUSH_EVERY = 64
+
+def _log(line):
+    _LOG_BUFFER.append(line)
+    if len(_LOG_BUFFER) >= _LOG_FLUSH_EVERY:
+        _flush_log()
+
+def _flush_log():
+    if _LOG_BUFFER:
+        sys.stdout.write("\n".join(_LOG_BUFFER) + "\n")
+        _LOG_BUFFER.clear()
+
+def _scan_folder(folder):
+    """用一次 os.scandir 建立 {檔名: 完整路徑} 索引。
+
+    熱迴圈裡逐檔 os.path.join + os.path.exists 每次都是字串正規化
+    加一次 stat syscall；先掃一次目錄後改用 dict 查找即可歸零。
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_file()}
+    except OSError:
+        # 同 _stat：連權限不足也一併視為空資料夾，交由後續流程回報
+        return {}
+
+_WRITE_CHUNK_SIZE = 8 << 20  # 8 MiB
+
+def _write_buffer(path, buf):
+    """以 memoryview 分塊寫出整包位元組，避免對巨大 bytes 再做切片複製。"""
+    view = memoryview(buf)
+    with open(path, "wb") as f:
+        for offset in range(0, len(view), _WRITE_CHUNK_SIZE):
+            f.write(view[offset:offset + _WRITE_CHUNK_SIZE])
+
+_COPY_BUFFER_SIZE = 1 << 20  # 1 MiB，遠大於 shutil 預設的 64 KiB
+
+def _fastcopy(src, dst, allow_hardlink=False):
+    """以大緩衝區複製檔案，行為等同 shutil.copy2 (含中繼資料)。
+
+    多 MB 的 bundle / resources.assets 用預設 64 KiB 緩衝區會產生大量
+    syscall；在 Linux 上改用 os.sendfile 讓核心直接搬移資料，
+    Windows 上交給 CopyFileExW，其餘平台用 1 MiB readinto 迴圈。
+
+    allow_hardlink=True 時優先嘗試 os.link：Backup 資料夾建在遊戲根目錄下
+    (必定同一檔案系統)，硬連結讓備份瞬間完成且不佔空間。只用於「建立備份」——
+    之後覆蓋遊戲檔案是整檔 move (換 inode)，不會寫穿備份；
+    還原時一律走實體複製，避免還原後的遊戲檔與備份共用 inode。
+    """
+    # 別名防護：修改流程若在備份後、換檔前失敗，遊戲檔與硬連結備份
+    # 仍共用同一 inode，此時截斷式開啟 dst 會把兩份一起清空。
+    # 同一 inode 代表內容本來就一致，直接視為複製完成。
+    try:
+        if os.path.samefile(src, dst):
+            return
+    except OSError:
+        pass  # dst 不存在等情形照常複製
+    if allow_hardlink:
+        try:
+            if os.path.exists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # 跨檔案系統、權限或檔案系統不支援時退回複製
+    if sys.platform == "win32":
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            return
+        # CopyFileExW 失敗時退回 Python 複製路徑
+    elif sys.platform.startswith("linux"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            remaining = os.fstat(in_fd).st_size
+            offset = 0
+            # 優先用 copy_file_range：整段搬移都在核心內完成，
+            # 在 Btrfs/XFS 上還會觸發 CoW reflink (近乎零成本)。
+            # 舊核心不支援時退回 sendfile。
+            copier = getattr(os, "copy_file_range", None)
+            while remaining > 0:
+                chunk = min(remaining, _COPY_BUFFER_SIZE)
+                if copier is not None:
+                    try:
+                        sent = copier(in_fd, out_fd, chunk, offset_src=offset, offset_dst=offset)
+                    except OSError:
+                        # copy_file_range 用顯式 offset_dst，out_fd 的檔案
+                        # 游標從未前進；中途切換到 sendfile 前先對齊已寫入
+                        # 的進度，否則後續寫入會從位移 0 蓋回去
+                        copier = None
+                        os.lseek(out_fd, offset, os.SEEK_SET)
+                        continue
+                else:
+                    sent = os.sendfile(out_fd, in_fd, offset, chunk)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        shutil.copystat(src, dst)
+        return
+    buf = bytearray(_COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+    shutil.copystat(src, dst)
 
 # ==============================================================================
 # --- 選單功能 ---
 # ==============================================================================
 def run_modding():
     print("\n[開始執行修改流程]")
+    _STAT_CACHE.clear()
     paths_to_check = [BUNDLE_FILE_PATH, TEXT_ASSETS_FILE_PATH, TITLE_BUNDLE_PATH, CHT_FOLDER_PATH]
     for path in paths_to_check:
-        if not path or not os.path.exists(path):
+        if not path or not _path_exists(path):
             print(f"\n[錯誤] 關鍵路徑或檔案不存在: {path}")
             print(f"請確保此程式位於遊戲根目錄下，且 {PLATFORM_NAME} 版本的遊戲檔案完整。")
             return
@@ -135,6 +429,8 @@ def run_modding():
         print("操作已取消。")
         return
 
+    _ensure_heavy_imports()
+
     try:
         if os.path.exists(BACKUP_FOLDER):
             print("\n[步驟 1/4] 偵測到舊的備份資料夾，正在移除...")
@@ -142,15 +438,13 @@ def run_modding():
             print("舊備份已移除。")
 
         print("\n[步驟 1/4] 正在建立新的原始檔案備份...")
-        backup_bundle_target = os.path.join(BACKUP_FOLDER, os.path.relpath(BUNDLE_FILE_PATH, GAME_ROOT_PATH))
-        backup_assets_target = os.path.join(BACKUP_FOLDER, os.path.relpath(TEXT_ASSETS_FILE_PATH, GAME_ROOT_PATH))
-        backup_title_target = os.path.join(BACKUP_FOLDER, os.path.relpath(TITLE_BUNDLE_PATH, GAME_ROOT_PATH))
-        os.makedirs(os.path.dirname(backup_bundle_target), exist_ok=True)
-        os.makedirs(os.path.dirname(backup_assets_target), exist_ok=True)
-        os.makedirs(os.path.dirname(backup_title_target), exist_ok=True)
-        shutil.copy2(BUNDLE_FILE_PATH, backup_bundle_target)
-        shutil.copy2(TEXT_ASSETS_FILE_PATH, backup_assets_target)
-        shutil.copy2(TITLE_BUNDLE_PATH, backup_title_target)
+        # 先循序建立所有備份目錄 (去重後每個目錄只一次 makedirs)，
+        # 也避免多執行緒同時 makedirs
+        for backup_dir in sorted({os.path.dirname(backup_path) for _, backup_path in BACKUP_PAIRS}, key=len):
+            os.makedirs(backup_dir, exist_ok=True)
+        # 三個檔案互相獨立且皆為 I/O 密集，平行複製可重疊磁碟延遲
+        with ThreadPoolExecutor(max_workers=len(BACKUP_PAIRS)) as executor:
+            list(executor.map(lambda pair: _fastcopy(*pair, allow_hardlink=True), BACKUP_PAIRS))
         print("新備份已建立至 'Backup' 資料夾。")
 
         # 載入與修改資源
@@ -160,43 +454,79 @@ def run_modding():
         if UNITY_VERSION: UnityPy.config.FALLBACK_UNITY_VERSION = UNITY_VERSION
         
         # --- Mac版修正點 ---
-        generator = TypeTreeGenerator(UNITY_VERSION)
-        
-        # 根據平台使用不同的載入方法
-        if sys.platform == "darwin": # macOS
-            print("[資訊] 偵測到 macOS，使用 DLL 資料夾模式載入 TypeTreeGenerator...")
-            # 構建到 Managed 資料夾的精確路徑
-            managed_folder_path = os.path.join(SILKSONG_DATA_PATH, "Managed")
-            generator.load_dll_folder(managed_folder_path)
-        else: # Windows and Linux
-            generator.load_local_game(GAME_ROOT_PATH)
-        
-        #
-        bundle_env = UnityPy.load(BUNDLE_FILE_PATH)
+        def _load_typetree_generator():
+            generator = TypeTreeGenerator(UNITY_VERSION)
+            # 根據平台使用不同的載入方法
+            if sys.platform == "darwin": # macOS
+                print("[資訊] 偵測到 macOS，使用 DLL 資料夾模式載入 TypeTreeGenerator...")
+                # 構建到 Managed 資料夾的精確路徑
+                managed_folder_path = os.path.join(SILKSONG_DATA_PATH, "Managed")
+                generator.load_dll_folder(managed_folder_path)
+            else: # Windows and Linux
+                generator.load_local_game(GAME_ROOT_PATH)
+            return generator
+
+        # TypeTree 掃描與三個資源檔的載入互相獨立且都是 I/O 密集，
+        # 平行執行讓磁碟讀取重疊，耗時趨近其中最慢的一項而非總和
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            generator_future = executor.submit(_load_typetree_generator)
+            bundle_future = executor.submit(UnityPy.load, BUNDLE_FILE_PATH)
+            text_future = executor.submit(UnityPy.load, TEXT_ASSETS_FILE_PATH)
+            title_future = executor.submit(UnityPy.load, TITLE_BUNDLE_PATH)
+        generator = generator_future.result()
+        bundle_env = bundle_future.result()
         bundle_env.typetree_generator = generator
-        text_env = UnityPy.load(TEXT_ASSETS_FILE_PATH)
-        title_env = UnityPy.load(TITLE_BUNDLE_PATH)
+        text_env = text_future.result()
+        title_env = title_future.result()
         title_env.typetree_generator = generator
 
-        process_bundle(bundle_env)
-        process_text_assets(text_env)
-        process_title_bundle(title_env)
+        # 三個環境各自獨立 (FALLBACK_UNITY_VERSION 已在進池前設定)：
+        # 文本處理偏磁碟 I/O、bundle 處理偏 BC7 編碼 CPU，平行執行可互相
+        # 掩蓋等待時間；result() 會把工作執行緒內的例外原樣拋回主執行緒
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            bundle_job = executor.submit(process_bundle, bundle_env)
+            text_job = executor.submit(process_text_assets, text_env)
+            title_job = executor.submit(process_title_bundle, title_env)
+        bundle_job.result()
+        text_job.result()
+        title_job.result()
         print("資源修改完成。")
 
         # ... (重新打包和覆蓋檔案的程式碼保持不變) ...
         print("\n[步驟 3/4] 正在重新打包修改後的檔案...")
-        modified_bundle_path = os.path.join(TEMP_WORKSPACE_FOLDER, os.path.basename(BUNDLE_FILE_PATH))
-        modified_text_assets_path = os.path.join(TEMP_WORKSPACE_FOLDER, os.path.basename(TEXT_ASSETS_FILE_PATH))
-        modified_title_bundle_path = os.path.join(TEMP_WORKSPACE_FOLDER, os.path.basename(TITLE_BUNDLE_PATH))
-        with open(modified_bundle_path, "wb") as f: f.write(bundle_env.file.save())
-        with open(modified_text_assets_path, "wb") as f: f.write(text_env.file.save())
-        with open(modified_title_bundle_path, "wb") as f: f.write(title_env.file.save())
+        # UnityPy 的 save() 只能一次吐出完整 bytes，無法真正串流；
+        # 退而求其次：逐一打包、分塊寫出並立刻釋放該環境，
+        # 峰值記憶體只需容納單一檔案的重打包結果
+        _write_buffer(MODIFIED_BUNDLE_PATH, bundle_env.file.save())
+        bundle_env = None
+        _write_buffer(MODIFIED_TEXT_ASSETS_PATH, text_env.file.save())
+        text_env = None
+        _write_buffer(MODIFIED_TITLE_BUNDLE_PATH, title_env.file.save())
+        title_env = None
         print("打包完成。")
 
         print("\n[步驟 4/4] 正在用新檔案覆蓋遊戲檔案...")
-        shutil.move(modified_bundle_path, BUNDLE_FILE_PATH)
-        shutil.move(modified_text_assets_path, TEXT_ASSETS_FILE_PATH)
-        shutil.move(modified_title_bundle_path, TITLE_BUNDLE_PATH)
+        # temp_workspace 與遊戲目錄同一檔案系統，os.replace 是原子的
+        # rename (O(1) 中繼資料操作)，不像 shutil.move 跨裝置時會退化成
+        # 整檔複製＋刪除；萬一真的跨檔案系統再退回 shutil.move
+        def _replace_file(src, dst):
+            try:
+                os.replace(src, dst)
+            except OSError:
+                # 跨檔案系統時退回複製，但絕不就地覆寫 dst——那會寫穿
+                # 與備份共用的 inode。先複製到目的目錄下的暫存名，
+                # 再原子 rename 換掉 dst (換 inode，備份不受影響)
+                tmp = dst + ".sk_cht_new"
+                try:
+                    _fastcopy(src, tmp)
+                    os.replace(tmp, dst)
+                finally:
+                    if os.path.exists(tmp):
+                        os.remove(tmp)
+                os.remove(src)
+        _replace_file(MODIFIED_BUNDLE_PATH, BUNDLE_FILE_PATH)
+        _replace_file(MODIFIED_TEXT_ASSETS_PATH, TEXT_ASSETS_FILE_PATH)
+        _replace_file(MODIFIED_TITLE_BUNDLE_PATH, TITLE_BUNDLE_PATH)
         print("覆蓋完成！")
         print("\n== 所有操作已成功完成！==")
 
@@ -204,25 +534,27 @@ def run_modding():
         print(f"\n[嚴重錯誤] 操作過程中發生錯誤: {e}")
         traceback.print_exc()
     finally:
+        _flush_log()
+        _PNG_CACHE.clear()
+        _FONT_JSON_CACHE.clear()  # 釋放多 MB 的 glyph dict，下次重新讀取來源
+        globals()["_PNG_INDEX"] = None  # 下次執行重新掃描來源資料夾
         if os.path.exists(TEMP_WORKSPACE_FOLDER): shutil.rmtree(TEMP_WORKSPACE_FOLDER)
 
 def restore_backup():
     # ... (此函式無需改動)
     print("\n[開始執行還原備份流程]")
-    if not os.path.exists(BACKUP_FOLDER):
+    _STAT_CACHE.clear()
+    if not _path_exists(BACKUP_FOLDER):
         print("[錯誤] 找不到 'Backup' 資料夾，無法還原。")
         return
     try:
-        backup_bundle = os.path.join(BACKUP_FOLDER, os.path.relpath(BUNDLE_FILE_PATH, GAME_ROOT_PATH))
-        backup_assets = os.path.join(BACKUP_FOLDER, os.path.relpath(TEXT_ASSETS_FILE_PATH, GAME_ROOT_PATH))
-        backup_title = os.path.join(BACKUP_FOLDER, os.path.relpath(TITLE_BUNDLE_PATH, GAME_ROOT_PATH))
-        if not os.path.exists(backup_bundle) or not os.path.exists(backup_assets) or not os.path.exists(backup_title):
+        restore_pairs = [(backup_path, source_path) for source_path, backup_path in BACKUP_PAIRS]
+        if not all(_path_exists(backup_path) for backup_path, _ in restore_pairs):
             print("[錯誤] 備份資料夾中檔案不完整，無法還原。")
             return
         print("正在從 'Backup' 資料夾還原原始檔案...")
-        shutil.copy2(backup_bundle, BUNDLE_FILE_PATH)
-        shutil.copy2(backup_assets, TEXT_ASSETS_FILE_PATH)
-        shutil.copy2(backup_title, TITLE_BUNDLE_PATH)
+        with ThreadPoolExecutor(max_workers=len(restore_pairs)) as executor:
+            list(executor.map(lambda pair: _fastcopy(*pair), restore_pairs))
         print("\n== 檔案已成功還原！==")
     except Exception as e:
         print(f"\n[嚴重錯誤] 還原過程中發生錯誤: {e}")
@@ -242,49 +574,72 @@ def show_about():
 # ==============================================================================
 # --- 腳本核心邏輯 (處理 Unity 資源) ---
 # ==============================================================================
+def _find_texture2d(env, target_name):
+    """在 env 中尋找指定名稱的 Texture2D 並回傳其資料。
+
+    UnityPy 沒有不做完整解析就能窺看名稱的 API，title bundle 的
+    container 也不含 Texture2D 項目，所以仍得逐物件 read()；
+    這裡把非 Texture2D 的物件在 read() 前就略過，並於首個命中即返回。
+    """
+    for obj in env.objects:
+        if obj.type.name != "Texture2D":
+            continue
+        data = obj.read()
+        if getattr(data, "m_Name", None) == target_name:
+            return data
+    return None
+
 def process_title_bundle(env):
-    # ... (此函式無需改動)
     print("[資訊] 開始處理 Title Bundle...")
     TARGET_ASSET_NAME = "sactx-0-1024x1024-BC7-Title-228dda81"
     SOURCE_PNG_NAME = "logo.png"
-    source_png_path = os.path.join(PNG_SOURCE_FOLDER, SOURCE_PNG_NAME)
-    if not os.path.exists(source_png_path):
+    source_png_path = _png_path(SOURCE_PNG_NAME)
+    if source_png_path is None:
         print(f"  - [警告] 找不到源文件 '{SOURCE_PNG_NAME}'，跳過 Title Logo 替換。")
         return
-    for obj in env.objects:
-        if obj.type.name == "Texture2D":
-            try:
-                data = obj.read()
-                if hasattr(data, "m_Name") and data.m_Name == TARGET_ASSET_NAME:
-                    print(f"  - [紋理] 找到目標 Title Logo: '{data.m_Name}'")
-                    if not (data.m_StreamData and data.m_StreamData.path):
-                        print("  - [警告] Title Logo 不是 .resS 格式，暫不支援此種替換。")
-                        break
-                    with Image.open(source_png_path) as img:
-                        image_binary, new_format = Texture2DConverter.image_to_texture2d(img, data.m_TextureFormat, data.assets_file.target_platform)
-                    resS_path = os.path.basename(data.m_StreamData.path)
-                    bundle_file = data.assets_file.parent
-                    resS_file = bundle_file.files[resS_path]
-                    new_ress_stream = BytesIO(image_binary)
-                    wrapper = FileWrapper(resS_file, new_ress_stream)
-                    bundle_file.files[resS_path] = wrapper
-                    print(f"    - [資訊] 已為 '{resS_path}' 創建新的數據流。")
-                    data.m_StreamData.offset = 0
-                    data.m_StreamData.size = len(image_binary)
-                    data.m_Width = img.width
-                    data.m_Height = img.height
-                    data.m_TextureFormat = new_format
-                    data.m_CompleteImageSize = len(image_binary)
-                    if hasattr(data, 'image_data'): data.image_data = b""
-                    data.save()
-                    print(f"    - [紋理] 已成功更新 '{data.m_Name}' 的元數據。")
-                    break
-            except Exception as e:
-                print(f"  - [嚴重警告] 處理 Title Logo 時發生錯誤: {e}")
-                traceback.print_exc()
-                break
+    try:
+        data = _find_texture2d(env, TARGET_ASSET_NAME)
+        if data is None:
+            return
+        print(f"  - [紋理] 找到目標 Title Logo: '{data.m_Name}'")
+        if not (data.m_StreamData and data.m_StreamData.path):
+            print("  - [警告] Title Logo 不是 .resS 格式，暫不支援此種替換。")
+            return
+        with Image.open(source_png_path) as img:
+            image_binary, new_format = Texture2DConverter.image_to_texture2d(img, data.m_TextureFormat, data.assets_file.target_platform)
+        resS_path = os.path.basename(data.m_StreamData.path)
+        bundle_file = data.assets_file.parent
+        resS_file = bundle_file.files[resS_path]
+        wrapper = FileWrapper(resS_file, image_binary)
+        bundle_file.files[resS_path] = wrapper
+        print(f"    - [資訊] 已為 '{resS_path}' 創建新的數據流。")
+        data.m_StreamData.offset = 0
+        data.m_StreamData.size = len(image_binary)
+        data.m_Width = img.width
+        data.m_Height = img.height
+        data.m_TextureFormat = new_format
+        data.m_CompleteImageSize = len(image_binary)
+        if hasattr(data, 'image_data'): data.image_data = b""
+        data.save()
+        print(f"    - [紋理] 已成功更新 '{data.m_Name}' 的元數據。")
+    except Exception as e:
+        print(f"  - [嚴重警告] 處理 Title Logo 時發生錯誤: {e}")
+        traceback.print_exc()
 
 # --- 核心修改點：更新 process_font 和 process_material ---
+# 字型 JSON 快取：chinese_body_bold 與 do_not_use_chinese_body_bold 共用
+# 同一份多 MB 的 glyph JSON，解析一次後重複使用。
+_FONT_JSON_CACHE = {}
+
+def _load_font_json(source_json_path):
+    source_dict = _FONT_JSON_CACHE.get(source_json_path)
+    if source_dict is None:
+        with open(source_json_path, "rb") as f:
+            raw = f.read()
+        source_dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        _FONT_JSON_CACHE[source_json_path] = source_dict
+    return source_dict
+
 def process_font(obj_reader):
     try:
         data = obj_reader.read()
@@ -293,19 +648,16 @@ def process_font(obj_reader):
         source_json_path = os.path.join(FONT_SOURCE_FOLDER, f"{source_asset_name}.json")
         if os.path.exists(source_json_path):
             original_tree = obj_reader.read_typetree()
-            with open(source_json_path, "r", encoding="utf-8") as f:
-                # 使用 decimal.Decimal 來讀取 JSON，以保留浮點數精度
-                # 如果不需要，簡單的 json.load 也可以
-                source_dict = json.load(f)
+            source_dict = _load_font_json(source_json_path)
 
             # 完全替換邏輯：以源 JSON 為準
             if "m_fontInfo" in source_dict: original_tree["m_fontInfo"] = source_dict["m_fontInfo"]
             if "m_glyphInfoList" in source_dict: original_tree["m_glyphInfoList"] = source_dict["m_glyphInfoList"]
             
             obj_reader.save_typetree(original_tree)
-            print(f"  - [字型] 已從 JSON 完整替換 '{asset_name}' 的數據")
+            _log(f"  - [字型] 已從 JSON 完整替換 '{asset_name}' 的數據")
     except Exception as e:
-        print(f"  - [警告] 處理字型 '{getattr(data, 'm_Name', '未知')}' 時出錯: {e}")
+        _log(f"  - [警告] 處理字型 '{getattr(data, 'm_Name', '未知')}' 時出錯: {e}")
 
 def process_material(obj_reader):
     try:
@@ -313,62 +665,89 @@ def process_material(obj_reader):
         asset_name = tree.get("m_Name", "未知材質")
 
         if "m_SavedProperties" in tree and "m_Floats" in tree["m_SavedProperties"]:
-            # 創建一個新的列表來儲存修改後的浮點數屬性
-            new_floats = []
-            
-            # 標記我們是否找到了需要修改的屬性
-            height_modified = False
-            width_modified = False
-
-            # 遍歷舊的列表（或元組列表）
-            for key, value in tree["m_SavedProperties"]["m_Floats"]:
-                if key == "_TextureHeight":
-                    # 如果找到了，將修改後的值加入新列表
-                    new_floats.append([key, 4096.0])
-                    height_modified = True
-                elif key == "_TextureWidth":
-                    # 如果找到了，將修改後的值加入新列表
-                    new_floats.append([key, 4096.0])
-                    width_modified = True
-                else:
-                    # 如果不是我們要修改的，就將原始的鍵值對加入新列表
+            # 單趟重寫：要覆寫的屬性查表取值，迴圈本體不再分支
+            overrides = {"_TextureHeight": 4096.0, "_TextureWidth": 4096.0}
+            seen = set()
+            new_floats = [
+                [key, overrides.get(key, value)]
+                for key, value in tree["m_SavedProperties"]["m_Floats"]
+                if not seen.add(key)
+            ]
+            # 原始資料中沒有的覆寫屬性，補加到列表尾端
+            for key, value in overrides.items():
+                if key not in seen:
                     new_floats.append([key, value])
-            
-            # 如果遍歷完畢後發現原始資料中沒有這兩個屬性，就手動添加
-            if not height_modified:
-                new_floats.append(["_TextureHeight", 4096.0])
-                print(f"    - [資訊] 在 '{asset_name}' 中添加了 _TextureHeight")
-            if not width_modified:
-                new_floats.append(["_TextureWidth", 4096.0])
-                print(f"    - [資訊] 在 '{asset_name}' 中添加了 _TextureWidth")
-            
+                    _log(f"    - [資訊] 在 '{asset_name}' 中添加了 {key}")
+
             # 用我們創建的、完全可修改的新列表，替換掉原始的 m_Floats
             tree["m_SavedProperties"]["m_Floats"] = new_floats
             
             # 保存修改後的完整 typetree
             obj_reader.save_typetree(tree)
-            print(f"  - [材質] 已直接修改 '{asset_name}' 的紋理尺寸屬性")
+            _log(f"  - [材質] 已直接修改 '{asset_name}' 的紋理尺寸屬性")
         else:
-            print(f"  - [警告] 材質 '{asset_name}' 結構不符合預期，跳過修改。")
+            _log(f"  - [警告] 材質 '{asset_name}' 結構不符合預期，跳過修改。")
 
     except Exception as e:
-        print(f"  - [警告] 處理材質 '{getattr(obj_reader, 'm_Name', '未知')}' 時出錯: {e}")
+        _log(f"  - [警告] 處理材質 '{getattr(obj_reader, 'm_Name', '未知')}' 時出錯: {e}")
+
+# PNG 解碼快取：同一張圖集在 bundle 內被多個資產引用時只解碼一次。
+# 一律先轉成 RGBA 並強制 load()，避免 UnityPy 存檔時對惰性 PIL 影像重複解碼。
+_PNG_CACHE = {}
+
+# PNG 來源資料夾索引：首次使用時以單次 scandir 建立，之後的來源查找
+# 都是 dict 查詢，熱迴圈內不再有 stat syscall (也順帶避免 TOCTOU)。
+_PNG_INDEX = None
+
+def _png_path(filename):
+    global _PNG_INDEX
+    if _PNG_INDEX is None:
+        _PNG_INDEX = _scan_folder(PNG_SOURCE_FOLDER)
+    return _PNG_INDEX.get(filename)
+
+def _load_png(source_png_path):
+    img = _PNG_CACHE.get(source_png_path)
+    if img is None:
+        img = Image.open(source_png_path)
+        # draft() 提示解碼器直接輸出目標模式；PNG 解碼器目前忽略此提示
+        # (JPEG 限定)，但呼叫無副作用，若來源改用 JPEG 可少一次整圖轉換
+        img.draft("RGBA", img.size)
+        img.load()
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        _PNG_CACHE[source_png_path] = img
+    return img
 
 def process_embedded_texture(data):
     try:
         asset_name = data.m_Name
         source_asset_name = "chinese_body_bold Atlas" if asset_name == "do_not_use_chinese_body_bold Atlas" else asset_name
         safe_name = sanitize_filename(source_asset_name)
-        source_png_path = os.path.join(PNG_SOURCE_FOLDER, f"{safe_name}.png")
-        if os.path.exists(source_png_path):
-            with Image.open(source_png_path) as img:
-                data.image = img
-                data.m_Width = img.width
-                data.m_Height = img.height
-                data.save()
-                print(f"  - [紋理] 已成功替換 (內嵌模式) '{asset_name}'")
+        source_png_path = _png_path(f"{safe_name}.png")
+        if source_png_path is not None:
+            img = _load_png(source_png_path)
+            data.image = img
+            data.m_Width = img.width
+            data.m_Height = img.height
+            data.save()
+            _log(f"  - [紋理] 已成功替換 (內嵌模式) '{asset_name}'")
     except Exception as e:
-        print(f"  - [警告] 處理內嵌紋理 '{data.m_Name}' 時出錯: {e}")
+        _log(f"  - [警告] 處理內嵌紋理 '{data.m_Name}' 時出錯: {e}")
+
+def _fast_encode_uncompressed(img, target_format):
+    """未壓縮格式 (RGBA32/RGB24) 直接走 PIL 的 C 層 raw 輸出。
+
+    這類格式不需要區塊壓縮，image_to_texture2d 的通用分派只是多餘負擔；
+    比照 UnityPy 的語意先上下翻轉 (Unity 紋理由下而上儲存) 再 tobytes。
+    編碼器需求以外的格式回傳 None，由呼叫端走原本的轉換器。
+    """
+    mode = {"RGBA32": "RGBA", "RGB24": "RGB"}.get(getattr(target_format, "name", None))
+    if mode is None:
+        return None
+    flipped = img.transpose(Image.FLIP_TOP_BOTTOM)
+    if flipped.mode != mode:
+        flipped = flipped.convert(mode)
+    return flipped.tobytes(), target_format
 
 def process_ress_texture_group(texture_group):
     # ... (此函式無需改動)
@@ -378,147 +757,213 @@ def process_ress_texture_group(texture_group):
     bundle_file = first_texture.assets_file.parent
     print(f"  - [紋理組] 開始處理共享 '{resS_path}' 的 {len(texture_group)} 個紋理...")
     try:
-        new_datas = []
-        for tex_data in texture_group:
+        def _encode_one(tex_data):
             asset_name = tex_data.m_Name
             source_asset_name = "chinese_body_bold Atlas" if asset_name == "do_not_use_chinese_body_bold Atlas" else asset_name
             safe_name = sanitize_filename(source_asset_name)
-            source_png_path = os.path.join(PNG_SOURCE_FOLDER, f"{safe_name}.png")
-            if os.path.exists(source_png_path):
-                with Image.open(source_png_path) as img:
-                    image_binary, new_format = Texture2DConverter.image_to_texture2d(img, tex_data.m_TextureFormat, tex_data.assets_file.target_platform)
-                    new_datas.append({ "original_obj": tex_data, "image_binary": image_binary, "new_format": new_format, "img": img.copy() })
-
-        new_ress_stream = BytesIO()
+            source_png_path = _png_path(f"{safe_name}.png")
+            if source_png_path is None:
+                return None
+            with Image.open(source_png_path) as img:
+                img.draft("RGBA", img.size)
+                img.load()
+                encoded = _fast_encode_uncompressed(img, tex_data.m_TextureFormat)
+                if encoded is None:
+                    encoded = Texture2DConverter.image_to_texture2d(img, tex_data.m_TextureFormat, tex_data.assets_file.target_platform)
+                image_binary, new_format = encoded
+                # 只留尺寸而非 img.copy()：整張圖集的深拷貝會多佔數十 MB
+                return { "original_obj": tex_data, "image_binary": image_binary, "new_format": new_format, "size": img.size }
+
+        # 各紋理的 PNG 解碼與 BC7/DXT 編碼互相獨立，且都在 C 層釋放 GIL，
+        # 用執行緒池重疊 I/O 與編碼；executor.map 保證結果維持原有順序
+        with ThreadPoolExecutor(max_workers=min(len(texture_group), os.cpu_count() or 1)) as executor:
+            new_datas = [d for d in executor.map(_encode_one, texture_group) if d is not None]
+
+        # 先算好各段 offset 與總長，一次配置輸出緩衝再以切片賦值填入，
+        # 避免 BytesIO 動態成長造成的反覆 realloc 與 memcpy
         current_offset = 0
         for data_dict in new_datas:
             data_dict["new_offset"] = current_offset
-            new_ress_stream.write(data_dict["image_binary"])
             current_offset += len(data_dict["image_binary"])
-        
+        buf = bytearray(current_offset)
+        for data_dict in new_datas:
+            offset = data_dict["new_offset"]
+            buf[offset:offset + len(data_dict["image_binary"])] = data_dict["image_binary"]
+
         resS_file = bundle_file.files[resS_path]
         original_obj = resS_file._original if isinstance(resS_file, FileWrapper) else resS_file
-        wrapper = FileWrapper(original_obj, new_ress_stream)
+        # bytearray 直接交給 FileWrapper 持有，不再繞一層 BytesIO 複製
+        wrapper = FileWrapper(original_obj, buf)
         bundle_file.files[resS_path] = wrapper
         print(f"    - [資訊] 已成功重建 '{resS_path}'，新總大小: {current_offset} bytes")
 
         for data_dict in new_datas:
             tex_data = data_dict["original_obj"]
-            img = data_dict["img"]
             tex_data.m_StreamData.offset = data_dict["new_offset"]
             tex_data.m_StreamData.size = len(data_dict["image_binary"])
-            tex_data.m_Width = img.width
-            tex_data.m_Height = img.height
+            tex_data.m_Width, tex_data.m_Height = data_dict["size"]
             tex_data.m_TextureFormat = data_dict["new_format"]
             tex_data.m_CompleteImageSize = len(data_dict["image_binary"])
             if hasattr(tex_data, 'image_data'): tex_data.image_data = b""
             tex_data.save()
-            print(f"    - [紋理] 已更新 '{tex_data.m_Name}' 元數據 (新 offset: {data_dict['new_offset']})")
+            _log(f"    - [紋理] 已更新 '{tex_data.m_Name}' 元數據 (新 offset: {data_dict['new_offset']})")
     except Exception as e:
         print(f"  - [嚴重警告] 處理紋理組 '{resS_path}' 時發生錯誤: {e}")
         traceback.print_exc()
 
+# 目標資產名稱 -> 所屬類型，一次 dict 查找取代逐名稱的線性比對
+_BUNDLE_TARGET_KINDS = {
+    "chinese_body": "MonoBehaviour",
+    "chinese_body_bold": "MonoBehaviour",
+    "do_not_use_chinese_body_bold": "MonoBehaviour",
+    "simsun_tmpro Material": "Material",
+    "chinese_body_bold Material": "Material",
+    "do_not_use_chinese_body_bold Material": "Material",
+    "chinese_body Atlas": "Texture2D",
+    "chinese_body_bold Atlas": "Texture2D",
+    "do_not_use_chinese_body_bold Atlas": "Texture2D",
+}
+_BUNDLE_HANDLED_TYPES = frozenset(kind for kind in _BUNDLE_TARGET_KINDS.values())
+
 def process_bundle(env):
-    # ... (此函式無需改動)
     print("[資訊] 正在分析與分類所有資源...")
-    all_objects = []
-    def find_all_objects(container):
-        if hasattr(container, 'files') and container.files is not None:
-            for asset_file in list(container.files.values()):
+    # 以顯式堆疊迭代巢狀 BundleFile：免去每層的遞迴呼叫框架，
+    # 也不需要把所有物件先物化成一個大列表
+    def iter_all_objects(container):
+        stack = [container]
+        while stack:
+            files = getattr(stack.pop(), 'files', None)
+            if not files:
+                continue
+            for asset_file in list(files.values()):
                 if isinstance(asset_file, SerializedFile):
-                    all_objects.extend(asset_file.objects.values())
+                    yield from asset_file.objects.values()
                 elif isinstance(asset_file, BundleFile):
-                    find_all_objects(asset_file)
-    find_all_objects(env)
+                    stack.append(asset_file)
+    all_objects = iter_all_objects(env)
 
     materials_to_process, fonts_to_process, textures_by_ress = [], [], {}
     embedded_textures = []
 
+    # 先以類型過濾再 read()：read() 會走完整 TypeTree 解析，是分類階段
+    # 最貴的一步，無關類型的物件連 try 區塊都不進。UnityPy 沒有提供
+    # 不做完整解析就能窺看 m_Name 的 API (container 映射也不涵蓋
+    # Material/Texture2D)，因此名稱過濾只能發生在 read() 之後。
+    # 把迴圈內會重複觸發的全域/屬性查找收進區域變數，
+    # 數萬次迭代下 LOAD_FAST 比 LOAD_GLOBAL/dict 屬性查找省不少直譯器開銷
+    handled_types = _BUNDLE_HANDLED_TYPES
+    target_kind_of = _BUNDLE_TARGET_KINDS.get
+    basename = os.path.basename
     for obj in all_objects:
+        type_name = obj.type.name
+        if type_name not in handled_types:
+            continue
         try:
-            if obj.type.name in ["MonoBehaviour", "Material", "Texture2D"]:
-                data = obj.read()
-                if not (hasattr(data, 'm_Name') and data.m_Name): continue
-                asset_name = data.m_Name
-
-                if obj.type.name == "MonoBehaviour" and asset_name in ["chinese_body", "chinese_body_bold", "do_not_use_chinese_body_bold"]:
-                    fonts_to_process.append(data)
-                elif obj.type.name == "Material" and asset_name in ["simsun_tmpro Material", "chinese_body_bold Material", "do_not_use_chinese_body_bold Material"]:
-                    materials_to_process.append(data)
-                elif obj.type.name == "Texture2D" and asset_name in ["chinese_body Atlas", "chinese_body_bold Atlas", "do_not_use_chinese_body_bold Atlas"]:
-                    if data.m_StreamData and data.m_StreamData.path:
-                        resS_path = os.path.basename(data.m_StreamData.path)
-                        if resS_path not in textures_by_ress: textures_by_ress[resS_path] = []
-                        textures_by_ress[resS_path].append(data)
-                    else:
-                        embedded_textures.append(data)
+            data = obj.read()
+            asset_name = getattr(data, 'm_Name', None)
+            if not asset_name: continue
+            if target_kind_of(asset_name) != type_name:
+                continue
+
+            if type_name == "MonoBehaviour":
+                fonts_to_process.append(data)
+            elif type_name == "Material":
+                materials_to_process.append(data)
+            else:  # Texture2D
+                if data.m_StreamData and data.m_StreamData.path:
+                    resS_path = basename(data.m_StreamData.path)
+                    if resS_path not in textures_by_ress: textures_by_ress[resS_path] = []
+                    # 插入時就帶上排序鍵，之後用 C 實作的 itemgetter 排序
+                    textures_by_ress[resS_path].append((int(data.m_StreamData.offset), data))
+                else:
+                    embedded_textures.append(data)
         except Exception as e:
-            print(f"  - [警告] 預處理資源時出錯: {e}")
+            _log(f"  - [警告] 預處理資源時出錯: {e}")
 
     print("[資訊] 分類完成，開始按依賴順序應用修改...")
     for resS_path, texture_group in textures_by_ress.items():
-        texture_group.sort(key=lambda x: int(x.m_StreamData.offset))
-        process_ress_texture_group(texture_group)
+        texture_group.sort(key=itemgetter(0))
+        process_ress_texture_group([data for _, data in texture_group])
     for tex_data in embedded_textures:
         process_embedded_texture(tex_data)
     for font_data in fonts_to_process:
         process_font(font_data.object_reader)
     for mat_data in materials_to_process:
         process_material(mat_data.object_reader)
+    _flush_log()
 
 def process_text_assets(env):
-    # ... (此函式無需改動)
-    text_target_assets = {"ZH_Achievements", "ZH_AutoSaveNames", "ZH_Belltown", "ZH_Bonebottom", "ZH_Caravan", "ZH_City", "ZH_Coral", "ZH_Crawl", "ZH_Credits List", "ZH_Deprecated", "ZH_Dust", "ZH_Enclave", "ZH_Error", "ZH_Fast Travel", "ZH_Forge", "ZH_General", "ZH_Greymoor", "ZH_Inspect", "ZH_Journal", "ZH_Lore", "ZH_MainMenu", "ZH_Map Zones", "ZH_Peak", "ZH_Pilgrims", "ZH_Prompts", "ZH_Quests", "ZH_Shellwood", "ZH_Shop", "ZH_Song", "ZH_Titles", "ZH_Tools", "ZH_UI", "ZH_Under", "ZH_Wanderers", "ZH_Weave", "ZH_Wilds"}
+    # 每個目標文本只讀取 + 解碼一次；同名資產重複出現時直接取快取字串，
+    # 省掉重複的整檔讀取與 UTF-8 解碼。
+    text_cache = {}
+    text_file_index = _scan_folder(TEXT_SOURCE_FOLDER)
     for obj in env.objects:
         if obj.type.name == "TextAsset":
             data = obj.read()
-            if data and data.m_Name in text_target_assets:
-                source_txt_path = os.path.join(TEXT_SOURCE_FOLDER, f"{data.m_Name}.txt")
-                if os.path.exists(source_txt_path):
+            # getattr 取代 hasattr/truthiness 檢查：沒有 m_Name 的資產
+            # 不再走一次 raise/catch AttributeError 的慢路徑
+            asset_name = getattr(data, "m_Name", None)
+            if asset_name is not None and asset_name in TEXT_TARGET_ASSETS:
+                cached = text_cache.get(asset_name)
+                if cached is None:
+                    source_txt_path = text_file_index.get(f"{asset_name}.txt")
+                    if source_txt_path is None:
+                        continue
                     with open(source_txt_path, "rb") as f:
-                        local_bytes = f.read()
-                    data.m_Script = local_bytes.decode("utf-8", "surrogateescape")
-                    data.save()
+                        cached = f.read().decode("utf-8", "surrogateescape")
+                    text_cache[asset_name] = cached
+                data.m_Script = cached
+                data.save()
 
 # ==============================================================================
 # --- 主程式入口 ---
 # ==============================================================================
+# 選單分派表：選項直接對應處理函式，退出選項於主迴圈特判。
+MENU_HANDLERS = {
+    '1': run_modding,
+    '2': restore_backup,
+    '3': show_about,
+}
+
 def main_menu():
-    # ... (此函式無需改動)
+    # 平台支援與否在程序生命週期內不會改變，迴圈外檢查一次即可
+    if not BUNDLE_FILE_PATH:
+        print("="*60)
+        print("== 絲綢之歌繁體中文化工具 v1.2 ==")
+        print("="*60)
+        print(f"\n[錯誤] 不支援的作業系統 ({sys.platform})。")
+        input("\n按下 Enter 鍵退出...")
+        return
+
     while True:
         if sys.platform == 'win32': os.system('cls')
-        
+
         print("="*60)
         print("== 絲綢之歌繁體中文化工具 v1.2 ==") # 版本號更新
         print("="*60)
         print(f"作業系統: {PLATFORM_NAME}")
         print(f"遊戲目錄: {GAME_ROOT_PATH}")
-        
-        if not BUNDLE_FILE_PATH:
-            print(f"\n[錯誤] 不支援的作業系統 ({sys.platform})。")
-            input("\n按下 Enter 鍵退出...")
-            return
 
         print("\n請選擇要執行的操作：\n")
         print("  1. 進行繁體中文化")
         print("  2. 還原備份")
         print("  3. 關於")
         print("  4. 退出\n")
-        
+
         choice = input("請輸入選項 [1-4]: ").strip()
-        
-        if choice == '1': run_modding()
-        elif choice == '2': restore_backup()
-        elif choice == '3': show_about()
-        elif choice == '4':
+
+        if choice == '4':
             print("程式即將退出。")
             time.sleep(1)
             break
-        else:
+
+        handler = MENU_HANDLERS.get(choice)
+        if handler is None:
             print("\n無效的指令，請重新輸入。")
             time.sleep(1)
             continue
-            
+        handler()
+
         input("\n按下 Enter 鍵返回主選單...")
 
 if __name__ == "__main__":